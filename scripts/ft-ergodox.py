@@ -26,20 +26,27 @@ import os, sys
 from pathlib import Path
 import json
 import argparse
-from copy import deepcopy
-from subprocess import getstatusoutput
-import asyncio
+import shlex
 import subprocess
-from functools import partial
-from typing import Sequence, Any
-from asyncio import ensure_future
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 # 3rd party stuff
-from colorama import Fore, Back, Style
-from colorama import init as color_init
-color_init()
+_TTY = sys.stdout.isatty()
+if _TTY:
+    # colorama only exists to make ANSI escapes work on Windows consoles;
+    # when stdout is a pipe/log file we skip both the import and the
+    # escape sequences entirely:
+    from colorama import init as color_init
+    color_init()
 # Our own stuff
 from keycap import Keycap
 
+def bright(text):
+    """
+    Returns *text* wrapped in ANSI bold codes (when stdout is a terminal).
+    """
+    return f"\x1b[1m{text}\x1b[0m" if _TTY else text
+
 # Change these to the correct paths in your environment:
 OPENSCAD_PATH = Path("deps/OpenSCAD-2023.09.30.ai16393-x86_64.AppImage")
 COLORSCAD_PATH = Path("deps/colorscad/colorscad.sh")
@@ -49,116 +56,120 @@ BETWEENSPACE = 0.8 # Space between keycaps
 FILE_TYPE = "3mf" # 3mf or stl
 
 # BEGIN Async stuff
-# Mostly copied from https://gist.github.com/anti1869/e02c4212ce16286ea40f
-COMMANDS = []
 
-#MAX_RUNNERS = 8
-#SEM = asyncio.Semaphore(MAX_RUNNERS)
-
-def run_command(cmd: str) -> str:
-    """
-    Run prepared behave command in shell and return its output.
-    :param cmd: Well-formed behave command to run.
-    :return: Command output as string.
-    """
-    try:
-        output = subprocess.check_output(
-            cmd,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            shell=True,
-            cwd=os.getcwd(),
-        )
-
-    except subprocess.CalledProcessError as e:
-        output = e.output
-
-    return output
-
-
-# @asyncio.coroutine
-async def run_command_on_loop(loop: asyncio.AbstractEventLoop, command: str) -> bool:
-    """
-    Run test for one particular feature, check its result and return report.
-    :param loop: Loop to use.
-    :param command: Command to run.
-    :return: Result of the command.
-    """
-    async with SEM:
-        runner = partial(run_command, command)
-        output = await loop.run_in_executor(None, runner)
-        await asyncio.sleep(1)  # Slowing a bit for demonstration purposes
-        return output
-
-
-@asyncio.coroutine
-def run_all_commands(command_list: Sequence[str] = COMMANDS) -> None:
-    """
-    Run all commands in a list
-    :param command_list: List of commands to run.
-    """
-    loop = asyncio.get_event_loop()
-    fs = [run_command_on_loop(loop, command) for command in command_list]
-    for f in asyncio.as_completed(fs):
-        result = yield from f
-        ensure_future(process_result(result))
-
-
-@asyncio.coroutine
-def process_result(result: Any):
-    """
-    Do something useful with result of the commands
-    """
-    print(result)
+async def worker(queue: asyncio.Queue) -> None:
+    """
+    Pull commands off *queue* and run them until a None sentinel shows up.
+    Commands are launched directly (no shell) via the asyncio subprocess
+    machinery so nothing ever blocks the event loop.
+
+    Output is streamed line-by-line as it arrives--OpenSCAD can log for
+    minutes on complex keycaps--prefixed with the keycap's label so the
+    interleaved workers stay readable.
+    :param queue: Queue of (argv, label) tuples to run.
+    """
+    while (job := await queue.get()) is not None:
+        argv, label = job
+        try:
+            proc = await asyncio.create_subprocess_exec(*argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT)
+        except OSError as e:
+            print(f"{label}: {e}")
+            continue
+        prefix = b"[%s] " % label.encode()
+        async for line in proc.stdout:
+            sys.stdout.buffer.write(prefix + line)
+            sys.stdout.buffer.flush()
+        await proc.wait()
+
+
+async def run_all_commands(commands: list, jobs: int) -> None:
+    """
+    Run everything in *commands* through worker pools, so a new command is
+    dispatched as soon as any running one finishes.
+
+    Plain OpenSCAD renders (CPU-bound) get a pool of *jobs* workers while
+    colorscad invocations--which spend a good chunk of their time in file
+    I/O, merging the per-color parts--get their own slightly larger pool so
+    they don't hog render slots while waiting on the disk.
+    :param commands: List of (argv, label, est_cost) tuples to run.
+    :param jobs: How many CPU-bound renders may run simultaneously.
+    """
+    render_queue = asyncio.Queue()
+    colorscad_queue = asyncio.Queue()
+    for argv, label, est_cost in commands:
+        if argv[0] == str(COLORSCAD_PATH):
+            colorscad_queue.put_nowait((argv, label))
+        else:
+            render_queue.put_nowait((argv, label))
+    io_jobs = min(jobs * 2, 16)
+    for _ in range(jobs):
+        render_queue.put_nowait(None)  # One "stop" sentinel per worker
+    for _ in range(io_jobs):
+        colorscad_queue.put_nowait(None)
+    await asyncio.gather(
+        *[worker(render_queue) for _ in range(jobs)],
+        *[worker(colorscad_queue) for _ in range(io_jobs)])
 
 # END Async stuff
 
 class ergodox_ft_base(Keycap):
     """
     Base keycap definitions for the riskeycap profile + our personal prefs.
-    """
-    def __init__(self, homing_dot=False, **kwargs):
-        super().__init__(**kwargs,
-            openscad_path=OPENSCAD_PATH,
-            colorscad_path=COLORSCAD_PATH)
-        self.render = ["keycap", "stem"]
-        self.file_type = FILE_TYPE
-        self.key_profile = "riskeycap"
-        self.key_rotation = [110.1,0,0]
-        self.wall_thickness = 0.45*2.7
-        self.uniform_wall_thickness = True
-        self.dish_thickness = 1.0 # Note: Not actually used
-        self.dish_corner_fn = 40 # Save some rendering time
-        self.polygon_layers = 4  # Ditto
-        self.stem_height = 4
-        self.stem_type = "round_cherry"
-        self.stem_inset = -0.5
-        self.stem_walls_inset = 0
-        self.stem_inside_tolerance = 0.05
-        self.stem_side_supports = [0,0,1,0]
-        self.stem_locations = [[0,0,0]]
+
+    Each class in this hierarchy declares its static customizations in a
+    class-level `_OVERRIDES` dict; `apply_overrides()` (called once, here)
+    applies them all base-class-first followed by any caller kwargs, so
+    `postinit` runs exactly once per instance instead of once per class.
+    """
+    __slots__ = ()
+    _OVERRIDES = dict(
+        openscad_path=OPENSCAD_PATH,
+        colorscad_path=COLORSCAD_PATH,
+        render=["keycap", "stem"],
+        file_type=FILE_TYPE,
+        key_profile="riskeycap",
+        key_rotation=[110.1,0,0],
+        wall_thickness=0.45*2.7,
+        uniform_wall_thickness=True,
+        dish_thickness=1.0, # Note: Not actually used
+        dish_corner_fn=40, # Save some rendering time
+        polygon_layers=4,  # Ditto
+        stem_height=4,
+        stem_type="round_cherry",
+        stem_inset=-0.5,
+        stem_walls_inset=0,
+        stem_inside_tolerance=0.05,
+        stem_side_supports=[0,0,1,0],
+        stem_locations=[[0,0,0]],
         # Because we do strange things we need legends bigger on the Z
-        self.scale = [
-            [1,1,3],
-            [1,1,3],
-        ]
-        self.fonts = [
+        # (transform triples are tuples so they can be shared betweeen
+        # instances without any risk of cross-contamination)
+        scale=[
+            (1,1,3),
+            (1,1,3),
+        ],
+        fonts=[
             "Gotham Rounded:style=Bold",
             "Gotham Rounded:style=Bold",
-        ]
-        self.font_sizes = [
+        ],
+        font_sizes=[
             4.5, # Center
             3.5, # Front
-        ]
-        self.trans = [
-            [0,-2.6,0], # Center
-            [0,-2,2], # Front
-        ]
+        ],
+        trans=[
+            (0,-2.6,0), # Center
+            (0,-2,2), # Front
+        ],
         # Legend rotation
-        self.rotation = [
-            [-20,0,0], # Center
-            [68,0,0], # Front
-        ]
+        rotation=[
+            (-20,0,0), # Center
+            (68,0,0), # Front
+        ],
+    )
+    def __init__(self, homing_dot=False, **kwargs):
+        super().__init__(**kwargs)
         # Homing dot (set homing_dot=True to enable)
         if homing_dot:
             self.homing_dot_length = 1.5
@@ -166,496 +177,779 @@ class ergodox_ft_base(Keycap):
             self.homing_dot_x = 0
             self.homing_dot_y = -3
             self.homing_dot_z = -0.45
-        self.postinit(**kwargs)
+        self.apply_overrides(**kwargs)
 
 class ergodox_ft_icons(ergodox_ft_base):
     """
     For 1U with only icons
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.fonts = [
+    __slots__ = ()
+    _OVERRIDES = dict(
+        fonts=[
             "Font Awesome 6 Free:style=Solid",
             "Font Awesome 6 Free:style=Solid",
-        ]
-        self.font_sizes = [
+        ],
+        font_sizes=[
             5,
             3.9,
-        ]
+        ],
+    )
 
 class ergodox_ft_super(ergodox_ft_icons):
     """
     Super needs a rotated icon
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.rotation2 = [self.rotation[0], [0,0,0]]
-        self.rotation[0] = [0,0,90]
-        self.trans2 = [self.trans[0], [0,0,0]]
-        self.trans[0] = [0,0,0]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    # Rotate the main icon 90 degrees (the base trans/rotation move to
+    # trans2/rotation2 so they still apply after the spin):
+    _OVERRIDES = dict(
+        rotation=[(0,0,90), (68,0,0)],
+        rotation2=[(-20,0,0), (0,0,0)],
+        trans=[(0,0,0), (0,-2,2)],
+        trans2=[(0,-2.6,0), (0,0,0)],
+    )
 
 class ergodox_ft_front_icon(ergodox_ft_base):
     """
     For 1U with icon fronts (media keys, etc.)
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.fonts[1] = "Font Awesome 6 Free:style=Solid"
-        self.font_sizes[1] = 3.9
+    __slots__ = ()
+    _OVERRIDES = dict(
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid",
+        ],
+        font_sizes=[
+            4.5,
+            3.9,
+        ],
+    )
 
 class ergodox_ft_bl(ergodox_ft_front_icon):
     """
     For 1U with backlight controls, both icon and text label on front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.scale = [
-            self.scale[0],
-            self.scale[1], # Front 1
-            self.scale[1], # Front 2
-        ]
-        self.fonts = [
-            self.fonts[0],
-            self.fonts[1], # Front 1
-            self.fonts[0], # Front 2
-        ]
-        self.font_sizes = [
-            self.font_sizes[0],
-            self.font_sizes[1], # Front 1
-            3.5,                # Front 2
-        ]
-        self.trans = [
-            self.trans[0],
-            [-2,self.trans[1][1],self.trans[1][2]], # Front 1
-            [2,self.trans[1][1],self.trans[1][2]],  # Front 2
-        ]
-        self.rotation = [
-            self.rotation[0],
-            self.rotation[1], # Front 1
-            self.rotation[1], # Front 2
-        ]
+    __slots__ = ()
+    _OVERRIDES = dict(
+        scale=[
+            (1,1,3),
+            (1,1,3), # Front 1
+            (1,1,3), # Front 2
+        ],
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid", # Front 1
+            "Gotham Rounded:style=Bold",       # Front 2
+        ],
+        font_sizes=[
+            4.5,
+            3.9, # Front 1
+            3.5, # Front 2
+        ],
+        trans=[
+            (0,-2.6,0),
+            (-2,-2,2), # Front 1
+            (2,-2,2),  # Front 2
+        ],
+        rotation=[
+            (-20,0,0),
+            (68,0,0), # Front 1
+            (68,0,0), # Front 2
+        ],
+    )
 
 class ergodox_ft_bl_icon(ergodox_ft_bl):
     """
     For 1U with backlight controls, two icons on front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.fonts[2] = self.fonts[1]
-        self.font_sizes[2] = self.font_sizes[1]
-        self.trans[1][0] = -2.6
-        self.trans[2][0] = 2.6
+    __slots__ = ()
+    _OVERRIDES = dict(
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid", # Front 1
+            "Font Awesome 6 Free:style=Solid", # Front 2
+        ],
+        font_sizes=[
+            4.5,
+            3.9, # Front 1
+            3.9, # Front 2
+        ],
+        trans=[
+            (0,-2.6,0),
+            (-2.6,-2,2), # Front 1
+            (2.6,-2,2),  # Front 2
+        ],
+    )
 
 class ergodox_ft_text(ergodox_ft_base):
     """
     Ctrl, Del, etc. need to be downsized a smidge.
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.font_sizes[0] = 4
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4, # Center
+            3.5, # Front
+        ],
+    )
 
 class ergodox_ft_gem(ergodox_ft_base):
     """
     Same as base but in GEM profile
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.key_profile = "gem"
-        self.key_rotation = [108.6,0,0]
+    __slots__ = ()
+    _OVERRIDES = dict(
+        key_profile="gem",
+        key_rotation=[108.6,0,0],
+    )
 
 class ergodox_ft_gem_front_icon(ergodox_ft_front_icon):
     """
     1U with icon front, but in GEM profile
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.key_profile = "gem"
-        self.key_rotation = [108.6,0,0]
+    __slots__ = ()
+    _OVERRIDES = dict(
+        key_profile="gem",
+        key_rotation=[108.6,0,0],
+    )
 
 class ergodox_ft_multi(ergodox_ft_base):
     """
     For number row keys and others with multiple legends... ,./;'[]
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.fonts = [
+    __slots__ = ()
+    _OVERRIDES = dict(
+        fonts=[
             "Gotham Rounded:style=Bold", # Left
             "Gotham Rounded:style=Bold", # Center
             "Gotham Rounded:style=Bold", # Right
             "Gotham Rounded:style=Bold", # Front
-        ]
-        self.font_sizes = [
+        ],
+        font_sizes=[
             4.5, # Left
             4.5, # Center
             4.5, # Right
             3.5, # Front legend
-        ]
-        self.trans = [
-            [-2.6,-2.6,0], # Left
-            [0,-2.6,0], # Center
-            [2.6,-2.6,0], # Right
-            [0,-2,2], # F-key
-        ]
-        self.rotation = [
-            [-20,0,0],
-            [-20,0,0],
-            [-20,0,0],
-            [68,0,0],
-        ]
-        self.scale = [
-            [1,1,3],
-            [1,1,3],
-            [1,1,3],
-            [1,1,3],
-        ]
-        self.postinit(**kwargs)
+        ],
+        trans=[
+            (-2.6,-2.6,0), # Left
+            (0,-2.6,0), # Center
+            (2.6,-2.6,0), # Right
+            (0,-2,2), # F-key
+        ],
+        rotation=[
+            (-20,0,0),
+            (-20,0,0),
+            (-20,0,0),
+            (68,0,0),
+        ],
+        scale=[
+            (1,1,3),
+            (1,1,3),
+            (1,1,3),
+            (1,1,3),
+        ],
+    )
 
 class ergodox_ft_tilde(ergodox_ft_multi):
     """
     Tilde needs some changes because by default it's too small,
     and it has an icon front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[0] = 6.5 # ` symbol
-        self.font_sizes[2] = 5.5 # ~ symbol
-        self.fonts[3] = "Font Awesome 6 Free:style=Solid"
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            6.5, # ` symbol
+            4.5,
+            5.5, # ~ symbol
+            3.5,
+        ],
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid",
+        ],
+    )
 
 class ergodox_ft_2(ergodox_ft_multi):
     """
     2 needs some changes based on the @ symbol
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.scale[2][0] = 0.85 # Squash it a bit
+    __slots__ = ()
+    _OVERRIDES = dict(
+        scale=[
+            (1,1,3),
+            (1,1,3),
+            (0.85,1,3), # Squash @ a bit
+            (1,1,3),
+        ],
+    )
 
 class ergodox_ft_3(ergodox_ft_multi):
     """
     3 needs some changes based on the # symbol (slightly too big)
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[2] = 4.5 # # symbol
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4.5,
+            4.5,
+            4.5, # # symbol
+            3.5,
+        ],
+    )
 
 class ergodox_ft_5(ergodox_ft_multi):
     """
     5 needs some changes based on the % symbol (too big, too close to bar)
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[2] = 4 # % symbol
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4.5,
+            4.5,
+            4, # % symbol
+            3.5,
+        ],
+    )
 
 class ergodox_ft_6(ergodox_ft_multi):
     """
     6 needs some changes based on the ^ symbol (too small, should be up high),
     also icon front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[2] = 5.8 # ^ symbol
-        self.trans[2] = [2.6,-1.5,0]
-        self.fonts[3] = "Font Awesome 6 Free:style=Solid"
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4.5,
+            4.5,
+            5.8, # ^ symbol
+            3.5,
+        ],
+        trans=[
+            (-2.6,-2.6,0),
+            (0,-2.6,0),
+            (2.6,-1.5,0), # ^ symbol goes up high
+            (0,-2,2),
+        ],
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid",
+        ],
+    )
 
 class ergodox_ft_7(ergodox_ft_multi):
     """
     7 needs some changes based on the & symbol (it's too big)
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[2] = 4.5 # & symbol
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4.5,
+            4.5,
+            4.5, # & symbol
+            3.5,
+        ],
+    )
 
 class ergodox_ft_8(ergodox_ft_multi):
     """
     8 needs some changes based on the tiny * symbol
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[2] = 8.5 # * symbol
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4.5,
+            4.5,
+            8.5, # * symbol
+            3.5,
+        ],
+    )
 
 class ergodox_ft_0(ergodox_ft_multi):
     """
     0 also needs some changes based on the tiny * symbol
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.font_sizes[3] = 6.6 # * symbol
+    __slots__ = ()
+    _OVERRIDES = dict(
+        font_sizes=[
+            4.5,
+            4.5,
+            4.5,
+            6.6, # * symbol
+        ],
+    )
 
 class ergodox_ft_slash(ergodox_ft_multi):
     """
     /?, needs rotated Font Awesome front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.fonts[3] = "Font Awesome 6 Free:style=Solid"
-        self.font_sizes[3] = 3.9
-        # Rotate front legend 90 degrees clockwise
-        self.rotation2 = [[0,0,0], [0,0,0], [0,0,0], self.rotation[3]]
-        self.rotation[3] = [0,0,-90]
-        self.trans2 = [[0,0,0], [0,0,0], [0,0,0], self.trans[3]]
-        self.trans[3] = [0,0,0]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    # The front legend gets rotated 90 degrees clockwise (the usual front
+    # trans/rotation move to trans2/rotation2 so they apply after the spin):
+    _OVERRIDES = dict(
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid",
+        ],
+        font_sizes=[
+            4.5,
+            4.5,
+            4.5,
+            3.9,
+        ],
+        rotation=[(-20,0,0), (-20,0,0), (-20,0,0), (0,0,-90)],
+        rotation2=[(0,0,0), (0,0,0), (0,0,0), (68,0,0)],
+        trans=[(-2.6,-2.6,0), (0,-2.6,0), (2.6,-2.6,0), (0,0,0)],
+        trans2=[(0,0,0), (0,0,0), (0,0,0), (0,-2,2)],
+    )
 
 class ergodox_ft_1_5U(ergodox_ft_multi):
     """
     1.5U (with multiple legends)
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
-        self.key_length = KEY_UNIT*1.5-BETWEENSPACE
-        self.key_rotation = [109.335,0,0]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    _OVERRIDES = dict(
+        key_length=KEY_UNIT*1.5-BETWEENSPACE,
+        key_rotation=[109.335,0,0],
+    )
 
 class ergodox_ft_1_5U_front_icon(ergodox_ft_1_5U):
     """
     For 1.5U with icon fronts (Esc, =+ and \|)
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.fonts[3] = "Font Awesome 6 Free:style=Solid"
-        self.font_sizes[3] = 3.9
+    __slots__ = ()
+    _OVERRIDES = dict(
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid",
+        ],
+        font_sizes=[
+            4.5,
+            4.5,
+            4.5,
+            3.9,
+        ],
+    )
 
 class ergodox_ft_dash(ergodox_ft_1_5U):
     """
     The dash (-) is fine but the underscore (_) needs minor repositioning.
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.trans[2] = [2.8,-4.1,0] # _ needs to go down and to the right a bit
-        self.scale[2][0] = 0.8 # Also needs to be squished a bit
+    __slots__ = ()
+    _OVERRIDES = dict(
+        trans=[
+            (-2.6,-2.6,0),
+            (0,-2.6,0),
+            (2.8,-4.1,0), # _ needs to go down and to the right a bit
+            (0,-2,2),
+        ],
+        scale=[
+            (1,1,3),
+            (1,1,3),
+            (0.8,1,3), # _ also needs to be squished a bit
+            (1,1,3),
+        ],
+    )
 
 class ergodox_ft_semicolon(ergodox_ft_multi):
     """
     The semicolon ends up being slightly higher than the colon but it looks
     better if the top dot in both is aligned.
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.trans[0] = [-2.6,-3.1,0]
-        self.trans[2] = [2.6,-2.6,0]
+    __slots__ = ()
+    _OVERRIDES = dict(
+        trans=[
+            (-2.6,-3.1,0),
+            (0,-2.6,0),
+            (2.6,-2.6,0),
+            (0,-2,2),
+        ],
+    )
 
 class ergodox_ft_1_5UV(ergodox_ft_base):
     """
     The base for vertical 1.5U keycaps.
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.key_width = KEY_UNIT*1.5-BETWEENSPACE
-        self.key_rotation = [110.095,0,0]
-        self.trans[1] = [0,0,-0.65]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    _OVERRIDES = dict(
+        key_width=KEY_UNIT*1.5-BETWEENSPACE,
+        key_rotation=[110.095,0,0],
+        trans=[
+            (0,-2.6,0), # Center
+            (0,0,-0.65), # Front
+        ],
+    )
 
 class ergodox_ft_lbracket(ergodox_ft_multi):
     """
     1.5U vertical left bracket, needs Font Awesome front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.key_width = KEY_UNIT*1.5-BETWEENSPACE
-        self.key_rotation = [110.095,0,0]
-        self.fonts[3] = "Font Awesome 6 Free:style=Solid"
-        self.font_sizes[3] = 3.9
-        self.trans[3] = [0,0,-0.65]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    _OVERRIDES = dict(
+        key_width=KEY_UNIT*1.5-BETWEENSPACE,
+        key_rotation=[110.095,0,0],
+        fonts=[
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Gotham Rounded:style=Bold",
+            "Font Awesome 6 Free:style=Solid",
+        ],
+        font_sizes=[
+            4.5,
+            4.5,
+            4.5,
+            3.9,
+        ],
+        trans=[
+            (-2.6,-2.6,0),
+            (0,-2.6,0),
+            (2.6,-2.6,0),
+            (0,0,-0.65), # Front
+        ],
+    )
 
 class ergodox_ft_rbracket(ergodox_ft_lbracket):
     """
     1.5U vertical right bracket, needs rotated Font Awesome front
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        # Rotate front legend 90 degrees clockwise
-        self.rotation2 = [[0,0,0], [0,0,0], [0,0,0], self.rotation[3]]
-        self.rotation[3] = [0,0,-90]
-        self.trans2 = [[0,0,0], [0,0,0], [0,0,0], self.trans[3]]
-        self.trans[3] = [0,0,0]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    # Rotate the front legend 90 degrees clockwise (lbracket's front
+    # trans/rotation move to trans2/rotation2 so they apply after the spin):
+    _OVERRIDES = dict(
+        rotation=[(-20,0,0), (-20,0,0), (-20,0,0), (0,0,-90)],
+        rotation2=[(0,0,0), (0,0,0), (0,0,0), (68,0,0)],
+        trans=[(-2.6,-2.6,0), (0,-2.6,0), (2.6,-2.6,0), (0,0,0)],
+        trans2=[(0,0,0), (0,0,0), (0,0,0), (0,0,-0.65)],
+    )
 
 class ergodox_ft_2UV_icon(ergodox_ft_base):
     """
     The base for 2U vertical keys with icon legends (Enter and Backspace)
     Hackishly using a rotated horizontal 2U key due to a stem support bug
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.key_length = KEY_UNIT*2-BETWEENSPACE
-        self.key_rotation = [0,-110.095,90]
-        self.stem_locations = [[0,0,0], [12,0,0], [-12,0,0]]
-        self.rotation, self.rotation2 = self.rotation2, [[
-            self.rotation[0][1],
-            -self.rotation[0][0],
-            self.rotation[0][2],
-        ]]
-        self.rotation[0][2] = -90
-        self.trans, self.trans2 = self.trans2, [[
-            self.trans[0][1],
-            self.trans[0][0],
-            self.trans[0][2],
-        ]]
-        self.fonts = ["Font Awesome 6 Free:style=Solid"]
-        self.font_sizes = [5]
-        self.stem_side_supports = [1,0,0,0]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    # Since the whole key is rotated 90 degrees the icon gets counter-rotated
+    # on the Z and the base legend transforms move (axis-swapped) to
+    # trans2/rotation2:
+    _OVERRIDES = dict(
+        key_length=KEY_UNIT*2-BETWEENSPACE,
+        key_rotation=[0,-110.095,90],
+        stem_locations=[[0,0,0], [12,0,0], [-12,0,0]],
+        rotation=[(0,0,-90)],
+        rotation2=[(0,20,0)],
+        trans=[(0,0,0)],
+        trans2=[(-2.6,0,0)],
+        fonts=["Font Awesome 6 Free:style=Solid"],
+        font_sizes=[5],
+        stem_side_supports=[1,0,0,0],
+    )
 
 class ergodox_ft_enter(ergodox_ft_2UV_icon):
     """
     Enter key needs its icon rotated more
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        # Rotate "turn-down" 90 degrees further clockwise
-        self.rotation = [[
-            self.rotation[0][0],
-            self.rotation[0][1],
-            self.rotation[0][2] - 90,
-        ]]
-        self.postinit(**kwargs_copy)
+    __slots__ = ()
+    # "turn-down" gets rotated 90 degrees further clockwise:
+    _OVERRIDES = dict(
+        rotation=[(0,0,-180)],
+    )
 
 class ergodox_ft_space(ergodox_ft_2UV_icon):
     """
     Using a rotated horizontal 2U key gives a "spacier" top surface
     """
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
-        self.key_length = KEY_UNIT*2-BETWEENSPACE
-        self.dish_invert = True
-        self.use_colorscad = False
-        self.key_rotation = [0,-113.651,90]
-        self.polygon_layers = 16 # For a smoother top
-        self.postinit(**kwargs_copy)
-
-KEYCAPS = [
+    __slots__ = ()
+    _OVERRIDES = dict(
+        key_length=KEY_UNIT*2-BETWEENSPACE,
+        dish_invert=True,
+        use_colorscad=False,
+        key_rotation=[0,-113.651,90],
+        polygon_layers=16, # For a smoother top
+    )
+
+# NOTE: Keycaps are instantiated lazily (via get_keycap()) so that asking for
+#       just a few doesn't pay the construction cost of the whole set:
+KEYCAP_SPECS = {
     # Row 1
-    ergodox_ft_1_5U_front_icon(name="l_esc", legends=[" ", "Esc", "", "\uf0e7"]),
-    ergodox_ft_multi(name="l_1", legends=["1", "", "!", "F1"]),
-    ergodox_ft_2(name="l_2", legends=["2", "", "@", "F2"]),
-    ergodox_ft_3(name="l_3", legends=["3", "", "#", "F3"]),
-    ergodox_ft_multi(name="l_4", legends=["4", "", "$", "F4"]),
-    ergodox_ft_5(name="l_5", legends=["5", "", "%", "F5"]),
-    ergodox_ft_tilde(name="l_tilde", legends=["`", "", "~", "\uf030"]),
-
-    ergodox_ft_text(name="r_del", legends=["Del", "Ins"]),
-    ergodox_ft_6(name="r_6", legends=["6", "", "^", "# \uf023"]),
-    ergodox_ft_7(name="r_7", legends=["7", "", "&", "7"]),
-    ergodox_ft_8(name="r_8", legends=["8", "", "*", "8"]),
-    ergodox_ft_multi(name="r_9", legends=["9", "", "(", "9"]),
-    ergodox_ft_0(name="r_0", legends=["0", "", ")", "*"]),
-    ergodox_ft_1_5U_front_icon(name="r_equal", legends=["=", "", "+", "\uf0e7"]),
+    "l_esc": (ergodox_ft_1_5U_front_icon,
+              dict(legends=[" ", "Esc", "", "\uf0e7"])),
+    "l_1": (ergodox_ft_multi, dict(legends=["1", "", "!", "F1"])),
+    "l_2": (ergodox_ft_2, dict(legends=["2", "", "@", "F2"])),
+    "l_3": (ergodox_ft_3, dict(legends=["3", "", "#", "F3"])),
+    "l_4": (ergodox_ft_multi, dict(legends=["4", "", "$", "F4"])),
+    "l_5": (ergodox_ft_5, dict(legends=["5", "", "%", "F5"])),
+    "l_tilde": (ergodox_ft_tilde, dict(legends=["`", "", "~", "\uf030"])),
+
+    "r_del": (ergodox_ft_text, dict(legends=["Del", "Ins"])),
+    "r_6": (ergodox_ft_6, dict(legends=["6", "", "^", "# \uf023"])),
+    "r_7": (ergodox_ft_7, dict(legends=["7", "", "&", "7"])),
+    "r_8": (ergodox_ft_8, dict(legends=["8", "", "*", "8"])),
+    "r_9": (ergodox_ft_multi, dict(legends=["9", "", "(", "9"])),
+    "r_0": (ergodox_ft_0, dict(legends=["0", "", ")", "*"])),
+    "r_equal": (ergodox_ft_1_5U_front_icon,
+                dict(legends=["=", "", "+", "\uf0e7"])),
 
     # Row 2
-    ergodox_ft_1_5U(name="l_tab", legends=[" ", "Tab", ""]),
-    ergodox_ft_base(name="l_Q", legends=["Q", "F6"]),
-    ergodox_ft_base(name="l_W", legends=["W", "F7"]),
-    ergodox_ft_gem(name="l_W_gamer", legends=["W", "F7"]),
-    ergodox_ft_base(name="l_E", legends=["E", "F8"]),
-    ergodox_ft_base(name="l_R", legends=["R", "F9"]),
-    ergodox_ft_base(name="l_T", legends=["T", "F10"]),
-    ergodox_ft_lbracket(name="l_bracket", legends=["[", "", "{", "\uf55a"]),
-
-    ergodox_ft_rbracket(name="r_bracket", legends=["]", "", "}", "\uf3be"]),
-    ergodox_ft_base(name="r_Y", legends=["Y", "W 0"],),
-    ergodox_ft_base(name="r_U", legends=["U", "4"]),
-    ergodox_ft_base(name="r_I", legends=["I", "5"]),
-    ergodox_ft_base(name="r_O", legends=["O", "6"]),
-    ergodox_ft_base(name="r_P", legends=["P", "+"]),
-    ergodox_ft_dash(name="r_dash", legends=["-", "", "_", "-"]),
+    "l_tab": (ergodox_ft_1_5U, dict(legends=[" ", "Tab", ""])),
+    "l_Q": (ergodox_ft_base, dict(legends=["Q", "F6"])),
+    "l_W": (ergodox_ft_base, dict(legends=["W", "F7"])),
+    "l_W_gamer": (ergodox_ft_gem, dict(legends=["W", "F7"])),
+    "l_E": (ergodox_ft_base, dict(legends=["E", "F8"])),
+    "l_R": (ergodox_ft_base, dict(legends=["R", "F9"])),
+    "l_T": (ergodox_ft_base, dict(legends=["T", "F10"])),
+    "l_bracket": (ergodox_ft_lbracket, dict(legends=["[", "", "{", "\uf55a"])),
+
+    "r_bracket": (ergodox_ft_rbracket, dict(legends=["]", "", "}", "\uf3be"])),
+    "r_Y": (ergodox_ft_base, dict(legends=["Y", "W 0"])),
+    "r_U": (ergodox_ft_base, dict(legends=["U", "4"])),
+    "r_I": (ergodox_ft_base, dict(legends=["I", "5"])),
+    "r_O": (ergodox_ft_base, dict(legends=["O", "6"])),
+    "r_P": (ergodox_ft_base, dict(legends=["P", "+"])),
+    "r_dash": (ergodox_ft_dash, dict(legends=["-", "", "_", "-"])),
 
     # Row 3
-    ergodox_ft_1_5U_front_icon(name="l_bslash",
-                               legends=["\\", "", "|", "\uf0a1 \uf023"]),
-    ergodox_ft_front_icon(name="l_A", legends=["A", "\uf048"]),
-    ergodox_ft_front_icon(name="l_S", legends=["S", "\uf027"]),
-    ergodox_ft_front_icon(name="l_D", legends=["D", "\uf028"]),
-    ergodox_ft_gem_front_icon(name="l_A_gamer", legends=["A", "\uf048"]),
-    ergodox_ft_gem_front_icon(name="l_S_gamer", legends=["S", "\uf027"]),
-    ergodox_ft_gem_front_icon(name="l_D_gamer", legends=["D", "\uf028"]),
-    ergodox_ft_front_icon(name="l_F", legends=["F", "\uf051"],
-                          homing_dot=True),
-    ergodox_ft_front_icon(name="l_G", legends=["G", "\uf04b \uf04c"]),
-
-    ergodox_ft_base(name="r_H", legends=["H", "W ^"]),
-    ergodox_ft_base(name="r_J", legends=["J", "1"], homing_dot=True),
-    ergodox_ft_base(name="r_K", legends=["K", "2"]),
-    ergodox_ft_base(name="r_L", legends=["L", "3"]),
-    ergodox_ft_semicolon(name="r_semicolon", legends=[";", "", ":", "="]),
-    #ergodox_ft_1_5U(name="r_basic_quote", legends=["'", "", '"', "/"]),
-    ergodox_ft_1_5U(name="r_quote", legends=["\u2019", "", "\u201d", "/"]),
+    "l_bslash": (ergodox_ft_1_5U_front_icon,
+                 dict(legends=["\\", "", "|", "\uf0a1 \uf023"])),
+    "l_A": (ergodox_ft_front_icon, dict(legends=["A", "\uf048"])),
+    "l_S": (ergodox_ft_front_icon, dict(legends=["S", "\uf027"])),
+    "l_D": (ergodox_ft_front_icon, dict(legends=["D", "\uf028"])),
+    "l_A_gamer": (ergodox_ft_gem_front_icon, dict(legends=["A", "\uf048"])),
+    "l_S_gamer": (ergodox_ft_gem_front_icon, dict(legends=["S", "\uf027"])),
+    "l_D_gamer": (ergodox_ft_gem_front_icon, dict(legends=["D", "\uf028"])),
+    "l_F": (ergodox_ft_front_icon, dict(legends=["F", "\uf051"],
+                                        homing_dot=True)),
+    "l_G": (ergodox_ft_front_icon, dict(legends=["G", "\uf04b \uf04c"])),
+
+    "r_H": (ergodox_ft_base, dict(legends=["H", "W ^"])),
+    "r_J": (ergodox_ft_base, dict(legends=["J", "1"], homing_dot=True)),
+    "r_K": (ergodox_ft_base, dict(legends=["K", "2"])),
+    "r_L": (ergodox_ft_base, dict(legends=["L", "3"])),
+    "r_semicolon": (ergodox_ft_semicolon, dict(legends=[";", "", ":", "="])),
+    #"r_basic_quote": (ergodox_ft_1_5U, dict(legends=["'", "", '"', "/"])),
+    "r_quote": (ergodox_ft_1_5U, dict(legends=["\u2019", "", "\u201d", "/"])),
 
     # Row 4
-    ergodox_ft_1_5U(name="l_shift", legends=[" ", "Shift", "", ""]),
-    ergodox_ft_bl_icon(name="l_Z_bl", legends=["Z", "\uf0eb", "\uf011"]),
-    ergodox_ft_bl(name="l_X_bl", legends=["X", "\uf0eb", "-"]),
-    ergodox_ft_bl(name="l_C_bl", legends=["C", "\uf0eb", "+"]),
-    ergodox_ft_bl_icon(name="l_V_bl", legends=["V", "\uf0eb", "\ue4bb"]),
-    ergodox_ft_base(name="l_Z", legends=["Z"]), # For non-backlit keyboards
-    ergodox_ft_base(name="l_X", legends=["X"]), # For non-backlit keyboards
-    ergodox_ft_base(name="l_C", legends=["C"]), # For non-backlit keyboards
-    ergodox_ft_base(name="l_V", legends=["V"]), # For non-backlit keyboards
-    ergodox_ft_base(name="l_B", legends=["B"]),
-    ergodox_ft_1_5UV(name="l_fn", legends=["Fn"]),
-
-    ergodox_ft_1_5UV(name="r_fn", legends=["Fn"]),
-    ergodox_ft_base(name="r_N", legends=["N", "W ="]),
-    ergodox_ft_base(name="r_M", legends=["M", "0"]),
-    ergodox_ft_multi(name="r_comma", legends=[",", "", "<", ","]),
-    ergodox_ft_multi(name="r_period", legends=[".", "", ">", "."]),
-    ergodox_ft_slash(name="r_slash", legends=["/", "", "?", "\uf149"]),
-    ergodox_ft_1_5U(name="r_shift", legends=[" ", "Shift", "", ""]),
+    "l_shift": (ergodox_ft_1_5U, dict(legends=[" ", "Shift", "", ""])),
+    "l_Z_bl": (ergodox_ft_bl_icon, dict(legends=["Z", "\uf0eb", "\uf011"])),
+    "l_X_bl": (ergodox_ft_bl, dict(legends=["X", "\uf0eb", "-"])),
+    "l_C_bl": (ergodox_ft_bl, dict(legends=["C", "\uf0eb", "+"])),
+    "l_V_bl": (ergodox_ft_bl_icon, dict(legends=["V", "\uf0eb", "\ue4bb"])),
+    "l_Z": (ergodox_ft_base, dict(legends=["Z"])), # For non-backlit keyboards
+    "l_X": (ergodox_ft_base, dict(legends=["X"])), # For non-backlit keyboards
+    "l_C": (ergodox_ft_base, dict(legends=["C"])), # For non-backlit keyboards
+    "l_V": (ergodox_ft_base, dict(legends=["V"])), # For non-backlit keyboards
+    "l_B": (ergodox_ft_base, dict(legends=["B"])),
+    "l_fn": (ergodox_ft_1_5UV, dict(legends=["Fn"])),
+
+    "r_fn": (ergodox_ft_1_5UV, dict(legends=["Fn"])),
+    "r_N": (ergodox_ft_base, dict(legends=["N", "W ="])),
+    "r_M": (ergodox_ft_base, dict(legends=["M", "0"])),
+    "r_comma": (ergodox_ft_multi, dict(legends=[",", "", "<", ","])),
+    "r_period": (ergodox_ft_multi, dict(legends=[".", "", ">", "."])),
+    "r_slash": (ergodox_ft_slash, dict(legends=["/", "", "?", "\uf149"])),
+    "r_shift": (ergodox_ft_1_5U, dict(legends=[" ", "Shift", "", ""])),
 
     # Row 5
-    ergodox_ft_text(name="l_ctrl", legends=["Ctrl"]),
-    ergodox_ft_front_icon(name="l_F3", legends=["F3", "\uf0d9"]),
-    ergodox_ft_front_icon(name="l_F5", legends=["F5", "\uf0d7"]),
-    ergodox_ft_front_icon(name="l_F11", legends=["F11", "\uf0d8"]),
-    ergodox_ft_front_icon(name="l_F12", legends=["F12", "\uf0da"]),
-
-    ergodox_ft_icons(name="r_left", legends=["\uf0d9"]),
-    ergodox_ft_icons(name="r_down", legends=["\uf0d7"]),
-    ergodox_ft_icons(name="r_up", legends=["\uf0d8"]),
-    ergodox_ft_icons(name="r_right", legends=["\uf0da"]),
-    ergodox_ft_text(name="r_ctrl", legends=["Ctrl"]),
+    "l_ctrl": (ergodox_ft_text, dict(legends=["Ctrl"])),
+    "l_F3": (ergodox_ft_front_icon, dict(legends=["F3", "\uf0d9"])),
+    "l_F5": (ergodox_ft_front_icon, dict(legends=["F5", "\uf0d7"])),
+    "l_F11": (ergodox_ft_front_icon, dict(legends=["F11", "\uf0d8"])),
+    "l_F12": (ergodox_ft_front_icon, dict(legends=["F12", "\uf0da"])),
+
+    "r_left": (ergodox_ft_icons, dict(legends=["\uf0d9"])),
+    "r_down": (ergodox_ft_icons, dict(legends=["\uf0d7"])),
+    "r_up": (ergodox_ft_icons, dict(legends=["\uf0d8"])),
+    "r_right": (ergodox_ft_icons, dict(legends=["\uf0da"])),
+    "r_ctrl": (ergodox_ft_text, dict(legends=["Ctrl"])),
 
     # Left thumb cluster
-    ergodox_ft_base(name="l_pgup", legends=["PgUp", "Home"],
-                    font_sizes=[3, 3]),
-    ergodox_ft_base(name="l_pgdn", legends=["PgDn", "End"],
-                    font_sizes=[3, 3]),
-    ergodox_ft_space(name="l_space"),
-    ergodox_ft_enter(name="l_enter", legends=["\uf3be"]),
-    ergodox_ft_super(name="l_super", legends=["\uf197", "\uf0c9"]),
-    ergodox_ft_text(name="l_alt", legends=["Alt"]),
+    "l_pgup": (ergodox_ft_base, dict(legends=["PgUp", "Home"],
+                                     font_sizes=[3, 3])),
+    "l_pgdn": (ergodox_ft_base, dict(legends=["PgDn", "End"],
+                                     font_sizes=[3, 3])),
+    "l_space": (ergodox_ft_space, dict()),
+    "l_enter": (ergodox_ft_enter, dict(legends=["\uf3be"])),
+    "l_super": (ergodox_ft_super, dict(legends=["\uf197", "\uf0c9"])),
+    "l_alt": (ergodox_ft_text, dict(legends=["Alt"])),
 
     # Right thumb cluster
-    ergodox_ft_base(name="r_home", legends=["Home", "PgUp"],
-                    font_sizes=[3, 3]),
-    ergodox_ft_base(name="r_end", legends=["End", "PgDn"],
-                    font_sizes=[3, 3]),
-    ergodox_ft_2UV_icon(name="r_backspace", legends=["\uf55a"]),
-    ergodox_ft_space(name="r_space"),
-    ergodox_ft_icons(name="r_compose", legends=["\uf5ad"],),
-    ergodox_ft_text(name="r_alt", legends=["AltGr"], font_sizes=[3]),
-]
+    "r_home": (ergodox_ft_base, dict(legends=["Home", "PgUp"],
+                                     font_sizes=[3, 3])),
+    "r_end": (ergodox_ft_base, dict(legends=["End", "PgDn"],
+                                    font_sizes=[3, 3])),
+    "r_backspace": (ergodox_ft_2UV_icon, dict(legends=["\uf55a"])),
+    "r_space": (ergodox_ft_space, dict()),
+    "r_compose": (ergodox_ft_icons, dict(legends=["\uf5ad"])),
+    "r_alt": (ergodox_ft_text, dict(legends=["AltGr"], font_sizes=[3])),
+}
+
+def extract_openscad_appimage():
+    """
+    Returns the OpenSCAD executable to use for rendering.
+
+    AppImages re-mount their embedded squashfs on every invocation, which
+    costs real time when we spawn OpenSCAD once per keycap (OpenSCAD can't
+    render several `-o` outputs in one run).  To only pay that cost once we
+    extract the AppImage next to itself on the first run and launch the
+    extracted `AppRun` directly from then on; if anything about extraction
+    fails we just fall back to the AppImage.
+    """
+    if OPENSCAD_PATH.suffix != ".AppImage":
+        return OPENSCAD_PATH
+    extract_dir = OPENSCAD_PATH.with_suffix(".extracted")
+    apprun = extract_dir / "squashfs-root" / "AppRun"
+    if not apprun.exists():
+        try:
+            extract_dir.mkdir(exist_ok=True)
+            subprocess.run(
+                [OPENSCAD_PATH.resolve(), "--appimage-extract"],
+                cwd=extract_dir, check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            return OPENSCAD_PATH
+        if not apprun.exists(): # Extraction "worked" but made no AppRun
+            return OPENSCAD_PATH
+    return apprun
+
+def get_keycap(name):
+    """
+    Instantiates and returns the keycap named *name* from KEYCAP_SPECS.
+    """
+    keycap_class, kwargs = KEYCAP_SPECS[name]
+    return keycap_class(name=name, **kwargs)
+
+def build_command(spec):
+    """
+    Instantiates the keycap named in *spec*, applies its attribute overrides,
+    and returns the (argv, label) tuple to run.  Kept as a module-level
+    function so the command construction can be farmed out to worker
+    processes.
+    """
+    name, overrides = spec
+    keycap = get_keycap(name)
+    for attr, value in overrides.items():
+        setattr(keycap, attr, value)
+    # Rough render-cost estimate, used to dispatch the slowest keycaps (the
+    # 2U/high-polygon_layers ones) first so they don't become stragglers:
+    est_cost = keycap.polygon_layers * keycap.key_length * keycap.key_width
+    return keycap.build_argv(), f"{keycap.name}.{keycap.file_type}", est_cost
 
 def print_keycaps():
     """
-    Prints the names of all keycaps in KEYCAPS.
+    Prints the names of all keycaps in KEYCAP_SPECS.
     """
-    print(Style.BRIGHT +
-          f"Here's all the keycaps we can render:\n" + Style.RESET_ALL)
-    keycap_names = ", ".join(a.name for a in KEYCAPS)
+    print(bright(f"Here's all the keycaps we can render:\n"))
+    keycap_names = ", ".join(KEYCAP_SPECS)
     print(f"{keycap_names}")
 
+def main(args):
+    """
+    Collects every keycap that needs rendering (per *args*) and
+    dispatches the render commands.
+    """
+    os.makedirs(args.out, exist_ok=True)
+    print(bright(f"Outputting to: {args.out}"))
+    # Scan the output directory once up front instead of stat()ing every
+    # prospective output file below:
+    existing = {entry.name for entry in os.scandir(args.out)}
+    to_build = [] # (spec_name, overrides) pairs for build_command()
+    overrides = {"output_path": f"{args.out}",
+                 "openscad_path": extract_openscad_appimage()}
+    if args.skip_colorscad:
+        overrides["use_colorscad"] = False
+    if args.transparent:
+        overrides["stem_color"] = "#505050"
+    if args.names: # Just render the specified keycaps
+        # One case-insensitive index beats rescanning (and lowercasing) the
+        # whole spec dict for every name given on the command line:
+        by_name = {spec_name.lower(): spec_name for spec_name in KEYCAP_SPECS}
+        for name in args.names:
+            spec_name = by_name.get(name.lower())
+            if spec_name is None:
+                print(f"Could not find a keycap named {name}")
+                continue
+            # Compute each file name once; it gets used by the
+            # exists check and both messages below:
+            file_name = f"{spec_name}.{FILE_TYPE}"
+            out_path = f"{args.out}/{file_name}"
+            exists = False
+            if not args.force:
+                if file_name in existing:
+                    print(bright(f"{out_path} exists; skipping..."))
+                    exists = True
+            if not exists:
+                print(bright(f"Rendering {out_path}..."))
+                to_build.append((spec_name, overrides))
+            if args.legends:
+                legend_name = f"{spec_name}_legends"
+                # Change it to .stl since PrusaSlicer doesn't like .3mf
+                # for "parts" for unknown reasons...
+                legend_path = f"{args.out}/{legend_name}.stl"
+                if f"{legend_name}.stl" in existing:
+                    print(bright(f"{legend_path} exists; skipping..."))
+                    continue
+                print(bright(f"Rendering {legend_path}..."))
+                to_build.append((spec_name, dict(overrides,
+                    name=legend_name, file_type="stl")))
+    else:
+        # Render the keycaps (and, with --legends, a separate stl of each
+        # keycap's legends for multi-material printing) in a single pass:
+        for name, (keycap_class, kwargs) in KEYCAP_SPECS.items():
+            # Compute each file name once; it gets used by the exists check
+            # and both messages below:
+            file_name = f"{name}.{FILE_TYPE}"
+            out_path = f"{args.out}/{file_name}"
+            if not args.force and file_name in existing:
+                print(bright(f"{out_path} exists; skipping..."))
+            else:
+                print(bright(f"Rendering {out_path}..."))
+                to_build.append((name, overrides))
+            if not args.legends or kwargs.get("legends", [""]) == [""]:
+                continue # No separate legends wanted (or none to render)
+            # Legends use .stl since PrusaSlicer doesn't like .3mf
+            # for "parts" for unknown reasons...
+            legend_name = f"{name}_legends"
+            legend_path = f"{args.out}/{legend_name}.stl"
+            if not args.force and f"{legend_name}.stl" in existing:
+                print(bright(f"{legend_path} exists; skipping..."))
+                continue
+            print(bright(f"Rendering {legend_path}..."))
+            to_build.append((name, dict(overrides,
+                name=legend_name, render=["legends"],
+                file_type="stl")))
+    commands = [] # (argv, label, est_cost) tuples
+    if to_build:
+        # Building the ~50-variable OpenSCAD definitions for every keycap is
+        # nontrivial Python work; fan it out across CPU cores so the first
+        # render can launch sooner.
+        with ProcessPoolExecutor() as executor:
+            for argv, label, est_cost in executor.map(build_command, to_build):
+                print(shlex.join(argv))
+                commands.append((argv, label, est_cost))
+    # Dedup (e.g. the same name given twice on the command line) so OpenSCAD
+    # never gets run twice for identical work:
+    deduped = []
+    seen = set()
+    for argv, label, est_cost in commands:
+        key = tuple(argv)
+        if key not in seen:
+            seen.add(key)
+            deduped.append((argv, label, est_cost))
+    commands = deduped
+    # Longest job first: with a fixed pool of workers this stops the slow
+    # thumb cluster/2U keycaps from being the last thing still rendering
+    # after everything else finished:
+    commands.sort(key=lambda cmd: -cmd[2])
+    asyncio.run(run_all_commands(commands, args.jobs))
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Render a full set of ergodox_ft keycaps.")
@@ -684,7 +978,6 @@ if __name__ == "__main__":
         nargs='*', metavar="name",
         help='Optional name of specific keycap you wish to render')
     args = parser.parse_args()
-    SEM = asyncio.Semaphore(args.jobs)
     if len(sys.argv) == 1:
         parser.print_help()
         print("")
@@ -693,99 +986,4 @@ if __name__ == "__main__":
     if args.keycaps:
         print_keycaps()
         sys.exit(1)
-    if not os.path.exists(args.out):
-        print(Style.BRIGHT +
-              f"Output path, '{args.out}' does not exist; making it..."
-              + Style.RESET_ALL)
-        os.mkdir(args.out)
-    print(Style.BRIGHT + f"Outputting to: {args.out}" + Style.RESET_ALL)
-    if args.names: # Just render the specified keycaps
-        matched = False
-        for name in args.names:
-            for keycap in KEYCAPS:
-                if keycap.name.lower() == name.lower():
-                    keycap.output_path = f"{args.out}"
-                    matched = True
-                    exists = False
-                    if not args.force:
-                        if os.path.exists(f"{args.out}/{keycap.name}.{keycap.file_type}"):
-                            print(Style.BRIGHT +
-                                f"{args.out}/{keycap.name}.{keycap.file_type} exists; "
-                                f"skipping..."
-                                + Style.RESET_ALL)
-                            exists = True
-                    if args.skip_colorscad:
-                        keycap.use_colorscad = False
-                    if args.transparent:
-                        keycap.stem_color = "#505050"
-                    if not exists:
-                        print(Style.BRIGHT +
-                            f"Rendering {args.out}/{keycap.name}.{keycap.file_type}..."
-                            + Style.RESET_ALL)
-                        print(keycap)
-                        COMMANDS.append(str(keycap))
-                    if args.legends:
-                        keycap.name = f"{keycap.name}_legends"
-                        # Change it to .stl since PrusaSlicer doesn't like .3mf
-                        # for "parts" for unknown reasons...
-                        keycap.file_type = "stl"
-                        if os.path.exists(f"{args.out}/{keycap.name}.{keycap.file_type}"):
-                            print(Style.BRIGHT +
-                                f"{args.out}/{keycap.name}.{keycap.file_type} exists; "
-                                f"skipping..."
-                                + Style.RESET_ALL)
-                            continue
-                        print(Style.BRIGHT +
-                            f"Rendering {args.out}/{keycap.name}.{keycap.file_type}..."
-                            + Style.RESET_ALL)
-                        print(keycap)
-                        COMMANDS.append(str(keycap))
-        if not matched:
-            print(f"Cound not find a keycap named {name}")
-    else:
-        # First render the keycaps
-        for keycap in KEYCAPS:
-            keycap.output_path = f"{args.out}"
-            if not args.force:
-                if os.path.exists(f"{args.out}/{keycap.name}.{keycap.file_type}"):
-                    print(Style.BRIGHT +
-                        f"{args.out}/{keycap.name}.{keycap.file_type} exists; skipping..."
-                        + Style.RESET_ALL)
-                    continue
-            if args.skip_colorscad:
-                keycap.use_colorscad = False
-            if args.transparent:
-                keycap.stem_color = "#505050"
-            print(Style.BRIGHT +
-                f"Rendering {args.out}/{keycap.name}.{keycap.file_type}..."
-                + Style.RESET_ALL)
-            print(keycap)
-            COMMANDS.append(str(keycap))
-        # Next render the legends (for multi-material, non-transparent legends)
-        if args.legends:
-            for legend in KEYCAPS:
-                if legend.legends == [""]:
-                    continue # No actual legends
-                legend.name = f"{legend.name}_legends"
-                legend.output_path = f"{args.out}"
-                legend.render = ["legends"]
-                # Change it to .stl since PrusaSlicer doesn't like .3mf
-                # for "parts" for unknown reasons...
-                legend.file_type = "stl"
-                if not args.force:
-                    if os.path.exists(f"{args.out}/{legend.name}.{legend.file_type}"):
-                        print(Style.BRIGHT +
-                            f"{args.out}/{legend.name}.{legend.file_type} exists; skipping..."
-                            + Style.RESET_ALL)
-                        continue
-                if args.skip_colorscad:
-                    legend.use_colorscad = False
-                if args.transparent:
-                    legend.stem_color = "#505050"
-                print(Style.BRIGHT +
-                    f"Rendering {args.out}/{legend.name}.{legend.file_type}..."
-                    + Style.RESET_ALL)
-                print(legend)
-                COMMANDS.append(str(legend))
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(run_all_commands())
+    main(args)
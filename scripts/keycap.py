@@ -17,6 +17,16 @@ from pathlib import Path
 KEY_UNIT = 19.05 # Square that makes up the entire space of a key
 BETWEENSPACE = 0.8 # Space between keycaps
 
+# Cache of argv templates keyed on everything about a keycap *except* its
+# name/legends/output path (see Keycap.build_argv).  Lots of keycaps (e.g.
+# l_*/r_* pairs) only differ in those, so this saves rebuilding the whole
+# definitions string for each of them.
+_CMD_CACHE = {}
+
+# Placeholder spliced into cached argv templates where the output file and
+# legends go:
+_PLACEHOLDER = "\x00"
+
 class OpenSCADException(Exception):
     """
     Raised when OpenSCAD can't be found or it's not working correctly.
@@ -79,6 +89,28 @@ class Keycap(object):
         from subprocess import getstatusoutput
         retcode, output = getstatusoutput(str(tilde))
     """
+    # NOTE: Subclasses that want the memory savings too should declare
+    #       `__slots__ = ()` (they get a per-instance __dict__ otherwise).
+    __slots__ = (
+        "name", "output_path", "render", "key_height", "key_length",
+        "key_width", "key_profile", "key_top_difference", "key_top_x",
+        "key_top_y", "key_rotation", "wall_thickness", "dish_thickness",
+        "dish_invert", "dish_invert_division_x", "dish_invert_division_y",
+        "dish_type", "dish_x", "dish_y", "dish_z", "dish_depth", "dish_tilt",
+        "dish_tilt_curve", "dish_fn", "dish_corner_fn",
+        "uniform_wall_thickness", "polygon_layers", "polygon_layer_rotation",
+        "polygon_edges", "polygon_rotation", "corner_radius",
+        "corner_radius_curve", "stem_type", "stem_height",
+        "stem_top_thickness", "stem_inset", "stem_inside_tolerance",
+        "stem_outside_tolerance_x", "stem_outside_tolerance_y",
+        "stem_locations", "stem_side_supports", "stem_sides_wall_thickness",
+        "stem_snap_fit", "stem_walls_inset", "stem_walls_tolerance",
+        "stem_color", "homing_dot_length", "homing_dot_width", "homing_dot_x",
+        "homing_dot_y", "homing_dot_z", "legends", "fonts", "font_sizes",
+        "trans", "trans2", "rotation", "rotation2", "scale", "underset",
+        "legend_carved", "file_type", "keycap_playground_path",
+        "colorscad_path", "use_colorscad", "openscad_path", "openscad_args",
+    )
     def __init__(self,
             name=None,
             render=["keycap", "stem"],
@@ -216,13 +248,17 @@ class Keycap(object):
         # This speeds things up considerably:
         self.openscad_args = "--enable=fast-csg"
 
-    def quote(self, legends, with_colorscad = True):
+    def quote(self, legends, with_colorscad = True, shell = True):
         """
         Checks for the edge case of a single quote (') legend and converts it
         into `"'"'"'"` so that bash will pass it correclty to OpenSCAD via
         `getstatusoutput()`.  Also covers the double quote (") legend when
         running with colorscad.
 
+        Pass `shell=False` when the command will be launched without a shell
+        (e.g. via `exec()`); in that case only the escaping colorscad itself
+        needs is applied.
+
         .. note::
 
             Example of what it should look like: `LEGENDS=["'"'"'", "", "\""];`
@@ -230,7 +266,7 @@ class Keycap(object):
         properly_escaped_quote = r'''"'"'"'"'''
         out = "["
         for i, legend in enumerate(legends):
-            if legend == "'":
+            if legend == "'" and shell:
                 out += properly_escaped_quote + ","
             elif legend == '"' and with_colorscad:
                 out += r'"\\\"",'
@@ -281,10 +317,74 @@ class Keycap(object):
                 #render = ["keycap", "stem", "legends"]
                 render.append("legends")
                 with_colorscad = True
+        return (
+            f"{first_part}"
+            f"{self.definitions(render, with_colorscad)}' "
+            f"{last_part}"
+        )
+
+    def build_argv(self):
+        """
+        Returns the OpenSCAD command line to generate this keycap as an argv
+        list suitable for `exec()`-style launching (no shell quoting needed).
+
+        The argv is assembled from a template cached per (class, parameters)
+        in `_CMD_CACHE`; only the output file and legends get re-computed for
+        keycaps that differ in nothing else.
+        """
+        render = self.render
+        with_colorscad = False
+        if self.use_colorscad and str(self.colorscad_path): # Use colorscad.sh
+            # Check to make sure it actually exists
+            if os.path.exists(self.colorscad_path):
+                # Add openscad to the $PATH variable so colorscad can find it
+                os.environ["PATH"] += f"{self.openscad_path.parent}"
+                render = render + ["legends"]
+                with_colorscad = True
+        cache_key = (type(self), repr(sorted(
+            (k, repr(getattr(self, k))) for k in Keycap.__slots__
+            if k not in ("name", "legends", "output_path"))))
+        template = _CMD_CACHE.get(cache_key)
+        if template is None:
+            defs = self.definitions(render, with_colorscad, shell=False,
+                legends=_PLACEHOLDER)
+            if with_colorscad:
+                template = [
+                    str(self.colorscad_path),
+                    "-i", str(self.keycap_playground_path),
+                    "-o", _PLACEHOLDER,
+                    "-p", str(self.openscad_path),
+                    "--", self.openscad_args, "-D", defs,
+                ]
+            else:
+                template = [
+                    str(self.openscad_path), self.openscad_args,
+                    "-o", _PLACEHOLDER,
+                    "-D", defs,
+                    str(self.keycap_playground_path),
+                ]
+            _CMD_CACHE[cache_key] = template
+        output_file = f"{self.output_path}/{self.name}.{self.file_type}"
+        argv = list(template)
+        for i, arg in enumerate(argv):
+            if arg == _PLACEHOLDER:
+                argv[i] = output_file
+            elif _PLACEHOLDER in arg:
+                argv[i] = arg.replace(_PLACEHOLDER,
+                    self.quote(self.legends, with_colorscad, shell=False))
+        return argv
+
+    def definitions(self, render, with_colorscad, shell=True, legends=None):
+        """
+        Returns the `-D` argument payload (OpenSCAD variable definitions) that
+        describes this keycap.  *legends* can be given to override the quoted
+        legends payload (used for the `build_argv()` template cache).
+        """
+        if legends is None:
+            legends = self.quote(self.legends, with_colorscad, shell)
         # NOTE: Since OpenSCAD requires double quotes I'm using the json module
         #       to encode things that need it:
         return (
-            f"{first_part}"
             f"RENDER={json.dumps(render)}; "
             f"KEY_PROFILE={json.dumps(self.key_profile)}; "
             f"KEY_LENGTH={round(self.key_length,2)}; "
@@ -334,18 +434,18 @@ class Keycap(object):
             f"HOMING_DOT_X={self.homing_dot_x}; "
             f"HOMING_DOT_Y={self.homing_dot_y}; "
             f"HOMING_DOT_Z={self.homing_dot_z}; "
-            f"LEGENDS={self.quote(self.legends, with_colorscad)}; "
+            f"LEGENDS={legends}; "
             f"LEGEND_FONTS={json.dumps(self.fonts)}; "
             f"LEGEND_FONT_SIZES={self.font_sizes}; "
-            f"LEGEND_TRANS={self.trans}; "
-            f"LEGEND_TRANS2={self.trans2}; "
-            f"LEGEND_ROTATION={self.rotation}; "
-            f"LEGEND_ROTATION2={self.rotation2}; "
-            f"LEGEND_SCALE={self.scale}; "
-            f"LEGEND_UNDERSET={self.underset}; "
+# NOTE: json.dumps() so tuple-valued transforms serialize as OpenSCAD arrays:
+            f"LEGEND_TRANS={json.dumps(self.trans)}; "
+            f"LEGEND_TRANS2={json.dumps(self.trans2)}; "
+            f"LEGEND_ROTATION={json.dumps(self.rotation)}; "
+            f"LEGEND_ROTATION2={json.dumps(self.rotation2)}; "
+            f"LEGEND_SCALE={json.dumps(self.scale)}; "
+            f"LEGEND_UNDERSET={json.dumps(self.underset)}; "
 # NOTE: For some reason I have to duplicate RENDER here for it to work properly:
-            f"RENDER={json.dumps(render)};' "
-            f"{last_part}"
+            f"RENDER={json.dumps(render)};"
         )
 
     def postinit(self, **kwargs):
@@ -355,4 +455,18 @@ class Keycap(object):
         #print(f"postinit kwargs: {kwargs}")
         for k, v in kwargs.items():
             #print(f"Updating: {k}: {v}")
-            self.__dict__.update({k: v})
+            setattr(self, k, v)
+
+    def apply_overrides(self, **kwargs):
+        """
+        Applies every `_OVERRIDES` dict found in the class hierarchy (most
+        base class first) followed by *kwargs*.  This lets subclasses declare
+        their static attribute customizations at class scope instead of
+        reassigning them (and re-running `postinit`) at every level of
+        `__init__`, so `postinit` runs exactly once per instance no matter
+        how deep the hierarchy goes.
+        """
+        for cls in reversed(type(self).__mro__):
+            for k, v in vars(cls).get("_OVERRIDES", {}).items():
+                setattr(self, k, v)
+        self.postinit(**kwargs)